@@ -147,7 +147,11 @@ class App:
     ) -> Optional[Response]:
         """Find and call a callback, parse a response, handle exceptions."""
         scope = request.scope
-        path = f"{ scope.get('root_path', '') }{ scope['path'] }"
+        path = scope["path"]
+        root_path = scope.get("root_path")
+        if root_path:
+            path = root_path + path
+
         try:
             match = self.router(path, scope.get("method", "GET"))
 
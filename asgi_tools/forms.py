@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from io import BytesIO
+import os
+from io import BufferedRandom, BytesIO, FileIO
 from tempfile import SpooledTemporaryFile
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Final, Optional
 from urllib.parse import unquote_to_bytes
 
 from multidict import MultiDict
@@ -15,6 +16,14 @@ from .utils import parse_options_header
 if TYPE_CHECKING:
     from asgi_tools.request import Request
 
+# Uploads are written with os.writev in batches (where it is available)
+WRITEV: Final = hasattr(os, "writev")
+UPLOAD_BUFFER_SIZE: Final = 1024 * 1024
+UPLOAD_BUFFER_MAX_CHUNKS: Final = 512
+
+# The request body is passed to the parsers by chunks of this size (at least)
+FORM_CHUNK_SIZE: Final = 256 * 1024
+
 
 async def read_formdata(
     request: "Request",
@@ -33,8 +42,21 @@ async def read_formdata(
         reader = FormReader(request.charset)
 
     parser = reader.init_parser(request, max_size)
+    parser_write = parser.write
+
+    # Coalesce small ASGI messages to feed the parser with bigger chunks
+    chunks: list[bytes] = []
+    size = 0
     async for chunk in request.stream():
-        parser.write(chunk)
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= FORM_CHUNK_SIZE:
+            parser_write(b"".join(chunks))
+            chunks.clear()
+            size = 0
+
+    if chunks:
+        parser_write(b"".join(chunks))
 
     parser.finalize()
     return reader.form
@@ -43,13 +65,18 @@ async def read_formdata(
 class FormReader:
     """Process querystring form data."""
 
-    __slots__ = "form", "curname", "curvalue", "charset"
+    __slots__ = "fields", "curname", "curvalue", "charset"
 
     def __init__(self, charset: str):
         self.charset = charset
         self.curname = bytearray()
         self.curvalue = bytearray()
-        self.form: MultiDict = MultiDict()
+        self.fields: list[tuple[str, Any]] = []
+
+    @property
+    def form(self) -> MultiDict:
+        """Build a multidict from the parsed fields."""
+        return MultiDict(self.fields)
 
     def init_parser(self, _: "Request", max_size: int) -> BaseParser:
         return QueryStringParser(
@@ -68,9 +95,12 @@ class FormReader:
         self.curvalue += data[start:end]
 
     def on_field_end(self, *_):
-        self.form.add(
-            unquote_plus(self.curname).decode(self.charset),
-            unquote_plus(self.curvalue).decode(self.charset),
+        charset = self.charset
+        self.fields.append(
+            (
+                unquote_plus(self.curname).decode(charset),
+                unquote_plus(self.curvalue).decode(charset),
+            ),
         )
         self.curname.clear()
         self.curvalue.clear()
@@ -80,23 +110,31 @@ class MultipartReader(FormReader):
     """Process multipart formdata."""
 
     __slots__ = (
-        "form",
+        "fields",
         "curname",
         "curvalue",
         "charset",
         "name",
+        "is_file",
         "partdata",
+        "partdata_write",
         "headers",
         "upload_to",
+        "upload_buffer",
+        "upload_buffer_size",
         "file_memory_limit",
     )
 
     def __init__(self, charset: str, upload_to: Optional[Callable], file_memory_limit: int):
         super().__init__(charset)
         self.name = ""
+        self.is_file = False
         self.headers: dict[bytes, bytes] = {}
         self.partdata = BytesIO()
+        self.partdata_write = self.partdata.write
         self.upload_to = upload_to
+        self.upload_buffer: list[memoryview] = []
+        self.upload_buffer_size = 0
         self.file_memory_limit = file_memory_limit
 
     def init_parser(self, request: "Request", max_size: int) -> BaseParser:
@@ -124,7 +162,7 @@ class MultipartReader(FormReader):
         self.curvalue += data[start:end]
 
     def on_header_end(self, *_):
-        self.headers[bytes(self.curname.lower())] = bytes(self.curvalue)
+        self.headers[bytes(self.curname).lower()] = bytes(self.curvalue)
         self.curname.clear()
         self.curvalue.clear()
 
@@ -133,34 +171,81 @@ class MultipartReader(FormReader):
             self.headers[b"content-disposition"].decode(self.charset),
         )
         self.name = options["name"]
-        if "filename" in options:
+        self.is_file = "filename" in options
+        if self.is_file:
             upload_to = self.upload_to
             if upload_to is not None:
                 filename = upload_to(options["filename"])
-                self.partdata = f = open(filename, "wb+")  # noqa: SIM115, PTH123
+                if WRITEV:
+                    # Write to the raw file, it is buffered when the part is complete
+                    self.partdata = f = FileIO(filename, "w+")
+                    self.partdata_write = self.buffer_upload
+                else:
+                    self.partdata = f = open(filename, "wb+")  # noqa: SIM115, PTH123
+                    self.partdata_write = f.write
 
             else:
                 self.partdata = f = SpooledTemporaryFile(self.file_memory_limit)  # noqa: SIM115
                 f._file.name = options["filename"]  # type: ignore[]
+                self.partdata_write = f.write
 
             f.content_type = self.headers[b"content-type"].decode(self.charset)
 
     def on_part_data(self, data: bytes, start: int, end: int):
-        self.partdata.write(data[start:end])
+        self.partdata_write(memoryview(data)[start:end])
+
+    def buffer_upload(self, data: memoryview):
+        """Keep views to the received chunks and write them to the upload file in batches."""
+        upload_buffer = self.upload_buffer
+        upload_buffer.append(data)
+        self.upload_buffer_size += len(data)
+        if (
+            self.upload_buffer_size >= UPLOAD_BUFFER_SIZE
+            or len(upload_buffer) >= UPLOAD_BUFFER_MAX_CHUNKS
+        ):
+            self.flush_upload_buffer()
+
+    def flush_upload_buffer(self):
+        """Write the buffered part data to the upload file."""
+        upload_buffer = self.upload_buffer
+        if not upload_buffer:
+            return
+
+        fd = self.partdata.fileno()
+        written = os.writev(fd, upload_buffer)
+        if written < self.upload_buffer_size:
+            rest = memoryview(b"".join(upload_buffer))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest) :]
+
+        upload_buffer.clear()
+        self.upload_buffer_size = 0
 
     def on_part_end(self, *_):
+        if self.upload_buffer:
+            self.flush_upload_buffer()
+
         field_data = self.partdata
-        if isinstance(field_data, BytesIO):
-            self.form.add(self.name, field_data.getvalue().decode(self.charset))
+        if self.is_file:
+            if type(field_data) is FileIO:
+                raw, field_data = field_data, BufferedRandom(field_data)
+                if hasattr(raw, "content_type"):
+                    field_data.content_type = raw.content_type
 
-        else:
             field_data.seek(0)
-            self.form.add(self.name, field_data)
+            self.fields.append((self.name, field_data))
+            self.is_file = False
+
+        else:
+            self.fields.append((self.name, field_data.getvalue().decode(self.charset)))
 
         self.partdata = BytesIO()
+        self.partdata_write = self.partdata.write
         self.headers = {}
 
 
-def unquote_plus(value: bytearray) -> bytes:
+def unquote_plus(value: bytearray) -> bytes | bytearray:
     value = value.replace(b"+", b" ")
+    if b"%" not in value:
+        return value
     return unquote_to_bytes(bytes(value))
@@ -2,7 +2,8 @@
 
 """Work with multipart."""
 
-from io import BytesIO
+import os
+from io import BufferedRandom, BytesIO, FileIO
 from pathlib import Path
 from tempfile import SpooledTemporaryFile
 from urllib.parse import unquote_to_bytes
@@ -13,6 +14,15 @@ from .multipart cimport QueryStringParser, MultipartParser, BaseParser
 from .utils import parse_options_header
 
 
+# Uploads are written with os.writev in batches (where it is available)
+cdef bint WRITEV = hasattr(os, 'writev')
+cdef int UPLOAD_BUFFER_SIZE = 1024 * 1024
+cdef int UPLOAD_BUFFER_MAX_CHUNKS = 512
+
+# The request body is passed to the parsers by chunks of this size (at least)
+cdef int FORM_CHUNK_SIZE = 256 * 1024
+
+
 async def read_formdata(object request, int max_size, object upload_to,
                         int file_memory_limit=1024 * 1024) -> MultiDict:
     """Read formdata from the given request."""
@@ -23,8 +33,21 @@ async def read_formdata(object request, int max_size, object upload_to,
         reader = FormReader(request.charset)
 
     parser = reader.init_parser(request, max_size)
+    parser_write = parser.write
+
+    # Coalesce small ASGI messages to feed the parser with bigger chunks
+    cdef list chunks = []
+    cdef Py_ssize_t size = 0
     async for chunk in request.stream():
-        parser.write(chunk)
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= FORM_CHUNK_SIZE:
+            parser_write(b''.join(chunks))
+            chunks.clear()
+            size = 0
+
+    if chunks:
+        parser_write(b''.join(chunks))
 
     parser.finalize()
     return reader.form
@@ -36,13 +59,18 @@ cdef class FormReader:
     cdef str charset
     cdef bytearray curname
     cdef bytearray curvalue
-    cdef public object form
+    cdef public list fields
 
     def __init__(self, str charset):
         self.charset = charset
         self.curname = bytearray()
         self.curvalue = bytearray()
-        self.form: MultiDict = MultiDict()
+        self.fields = []
+
+    @property
+    def form(self):
+        """Build a multidict from the parsed fields."""
+        return MultiDict(self.fields)
 
     cpdef BaseParser init_parser(self, object request, int max_size):
         return QueryStringParser({
@@ -58,10 +86,10 @@ cdef class FormReader:
         self.curvalue += data[start:end]
 
     def on_field_end(self, bytes data, int start, int end):
-        self.form.add(
+        self.fields.append((
             unquote_plus(bytes(self.curname)).decode(self.charset),
             unquote_plus(bytes(self.curvalue)).decode(self.charset),
-        )
+        ))
         self.curname.clear()
         self.curvalue.clear()
 
@@ -70,20 +98,28 @@ cdef class MultipartReader(FormReader):
     """Parse multipart formdata."""
 
     cdef str name
+    cdef bint is_file
     cdef dict headers
     cdef object partdata
+    cdef object partdata_write
     cdef object upload_to
+    cdef list upload_buffer
+    cdef int upload_buffer_size
     cdef int file_memory_limit
 
     def __init__(self, str charset, object upload_to, int file_memory_limit):
         self.curname = bytearray()
         self.curvalue = bytearray()
-        self.form: MultiDict = MultiDict()
+        self.fields = []
         self.charset = charset
         self.name = ''
+        self.is_file = False
         self.headers = {}
         self.partdata = BytesIO()
+        self.partdata_write = self.partdata.write
         self.upload_to = upload_to
+        self.upload_buffer = []
+        self.upload_buffer_size = 0
         self.file_memory_limit = file_memory_limit
 
     cpdef BaseParser init_parser(self, object request, int max_size):
@@ -91,7 +127,7 @@ cdef class MultipartReader(FormReader):
         if not len(boundary):
             raise ValueError('Invalid content type boundary')
 
-        return MultipartParser(request.media.get('boundary'), {
+        return MultipartParser(boundary, {
             'header_end': self.on_header_end,
             'header_field': self.on_header_field,
             'headers_finished': self.on_headers_finished,
@@ -107,7 +143,7 @@ cdef class MultipartReader(FormReader):
         self.curvalue += data[start:end]
 
     def on_header_end(self, data: bytes, start: int, end: int):
-        self.headers[bytes(self.curname.lower())] = bytes(self.curvalue)
+        self.headers[bytes(self.curname).lower()] = bytes(self.curvalue)
         self.curname.clear()
         self.curvalue.clear()
 
@@ -115,30 +151,73 @@ cdef class MultipartReader(FormReader):
         _, options = parse_options_header(self.headers[b'content-disposition'].decode(self.charset))
         self.name = options['name']
         upload_to = self.upload_to
-        if 'filename' in options:
+        self.is_file = 'filename' in options
+        if self.is_file:
             if upload_to is not None:
                 filename = upload_to(options['filename'])
-                self.partdata = f = open(filename, 'wb+')
+                if WRITEV:
+                    # Write to the raw file, it is buffered when the part is complete
+                    self.partdata = f = FileIO(filename, 'w+')
+                    self.partdata_write = self.buffer_upload
+                else:
+                    self.partdata = f = open(filename, 'wb+')
+                    self.partdata_write = f.write
 
             else:
                 self.partdata = f = SpooledTemporaryFile(self.file_memory_limit)
                 f._file.name = options['filename']
+                self.partdata_write = f.write
 
             f.content_type = self.headers[b'content-type'].decode(self.charset)
 
-    def on_part_data(self, data: bytes, start: int, end: int):
-        self.partdata.write(data[start:end])
+    def on_part_data(self, bytes data, int start, int end):
+        self.partdata_write(memoryview(data)[start:end])
+
+    def buffer_upload(self, data):
+        """Keep views to the received chunks and write them to the upload file in batches."""
+        cdef list upload_buffer = self.upload_buffer
+        upload_buffer.append(data)
+        self.upload_buffer_size += len(data)
+        if (self.upload_buffer_size >= UPLOAD_BUFFER_SIZE or
+                len(upload_buffer) >= UPLOAD_BUFFER_MAX_CHUNKS):
+            self.flush_upload_buffer()
+
+    cpdef flush_upload_buffer(self):
+        """Write the buffered part data to the upload file."""
+        cdef list upload_buffer = self.upload_buffer
+        if not upload_buffer:
+            return
+
+        fd = self.partdata.fileno()
+        written = os.writev(fd, upload_buffer)
+        if written < self.upload_buffer_size:
+            rest = memoryview(b''.join(upload_buffer))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+
+        upload_buffer.clear()
+        self.upload_buffer_size = 0
 
     def on_part_end(self, data: bytes, start: int, end: int):
+        if self.upload_buffer:
+            self.flush_upload_buffer()
+
         field_data = self.partdata
-        if isinstance(field_data, BytesIO):
-            self.form.add(self.name, field_data.getvalue().decode(self.charset))
+        if self.is_file:
+            if type(field_data) is FileIO:
+                raw, field_data = field_data, BufferedRandom(field_data)
+                if hasattr(raw, 'content_type'):
+                    field_data.content_type = raw.content_type
 
-        else:
             field_data.seek(0)
-            self.form.add(self.name, field_data)
+            self.fields.append((self.name, field_data))
+            self.is_file = False
+
+        else:
+            self.fields.append((self.name, field_data.getvalue().decode(self.charset)))
 
         self.partdata = BytesIO()
+        self.partdata_write = self.partdata.write
         self.headers = {}
 
 
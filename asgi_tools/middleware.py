@@ -3,20 +3,23 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import os
+import sys
 from contextlib import suppress
 from contextvars import ContextVar
 from functools import partial
-from inspect import isawaitable
 from pathlib import Path
 from typing import TYPE_CHECKING, Awaitable, Callable, Final, Mapping, Optional, Union
 
 from http_router import Router
 
+from ._compat import aio_wait
 from .errors import ASGIError
 from .logs import logger
 from .request import Request
 from .response import Response, ResponseError, ResponseFile, ResponseRedirect, parse_response
-from .utils import to_awaitable
+from .utils import is_awaitable_result, to_awaitable
 
 if TYPE_CHECKING:
     from .types import TASGIApp, TASGIMessage, TASGIReceive, TASGIScope, TASGISend
@@ -25,7 +28,9 @@ if TYPE_CHECKING:
 class BaseMiddeware(metaclass=abc.ABCMeta):
     """Base class for ASGI-Tools middlewares."""
 
-    scopes: tuple[str, ...] = ("http", "websocket")
+    __slots__ = ("app",)
+
+    scopes: frozenset[str] = frozenset(("http", "websocket"))
 
     def __init__(self, app: Optional[TASGIApp] = None) -> None:
         """Save ASGI App."""
@@ -106,19 +111,23 @@ class ResponseMiddleware(BaseMiddeware):
         app = ResponseMiddleware(app)
 
     You are able to raise :class:`ResponseError` from yours ASGI_ apps and it
-    will be catched and returned as a response
+    will be catched and returned as a response (returning the error or redirect
+    instead of raising it skips the exception handling)
 
     """
 
+    __slots__ = ()
+
     async def __process__(self, scope: TASGIScope, receive: TASGIReceive, send: TASGISend):
         """Parse responses from callbacks."""
         try:
             result = await self.app(scope, receive, self.send)
-            response = parse_response(result)
-            await response(scope, receive, send)
 
         except (ResponseError, ResponseRedirect) as exc:
-            await exc(scope, receive, send)
+            result = exc
+
+        response = result if isinstance(result, Response) else parse_response(result)
+        await response(scope, receive, send)
 
     def send(self, _: TASGIMessage):
         raise RuntimeError("You can't use send() method in ResponseMiddleware")  # noqa: TRY003
@@ -145,15 +154,25 @@ class RequestMiddleware(BaseMiddeware):
 
     """
 
+    __slots__ = ()
+
     async def __process__(self, scope: TASGIScope, receive: TASGIReceive, send: TASGISend):
         """Replace scope with request object."""
         return await self.app(Request(scope, receive, send), receive, send)
 
 
+# Lifespan events and their (complete, failed) message types
+LIFESPAN_MESSAGES: Final = {
+    "startup": ("lifespan.startup.complete", "lifespan.startup.failed"),
+    "shutdown": ("lifespan.shutdown.complete", "lifespan.shutdown.failed"),
+}
+
+
 class LifespanMiddleware(BaseMiddeware):
     """Manage ASGI_ Lifespan events.
 
     :param ignore_errors: Ignore errors from startup/shutdown handlers
+    :param concurrent: Run startup/shutdown handlers concurrently (in order by default)
     :param on_startup: the list of callables to run when the app is starting
     :param on_shutdown: the list of callables to run when the app is finishing
 
@@ -189,7 +208,9 @@ class LifespanMiddleware(BaseMiddeware):
 
     """
 
-    scopes = ("lifespan",)
+    __slots__ = "ignore_errors", "concurrent", "logger", "__startup__", "__shutdown__"
+
+    scopes = frozenset(("lifespan",))
 
     def __init__(
         self,
@@ -197,12 +218,14 @@ class LifespanMiddleware(BaseMiddeware):
         *,
         logger=logger,
         ignore_errors: bool = False,
+        concurrent: bool = False,
         on_startup: Union[Callable, list[Callable], None] = None,
         on_shutdown: Union[Callable, list[Callable], None] = None,
     ) -> None:
         """Prepare the middleware."""
         super(LifespanMiddleware, self).__init__(app)
         self.ignore_errors = ignore_errors
+        self.concurrent = concurrent
         self.logger = logger
         self.__startup__: list[Callable] = []
         self.__shutdown__: list[Callable] = []
@@ -211,16 +234,16 @@ class LifespanMiddleware(BaseMiddeware):
 
     async def __process__(self, _: TASGIScope, receive: TASGIReceive, send: TASGISend):
         """Manage lifespan cycle."""
-        while True:
+        # ASGI servers send a startup message and then a shutdown one
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            msg = await self.run("startup", send)
+            await send(msg)
             message = await receive()
-            if message["type"] == "lifespan.startup":
-                msg = await self.run("startup", send)
-                await send(msg)
 
-            elif message["type"] == "lifespan.shutdown":
-                msg = await self.run("shutdown", send)
-                await send(msg)
-                break
+        if message["type"] == "lifespan.shutdown":
+            msg = await self.run("shutdown", send)
+            await send(msg)
 
     def __register__(
         self, handlers: Union[Callable, list[Callable], None], container: list[Callable]
@@ -245,24 +268,48 @@ class LifespanMiddleware(BaseMiddeware):
 
     async def run(self, event: str, _: Optional[TASGISend] = None):
         """Run startup/shutdown handlers."""
-        assert event in {"startup", "shutdown"}
+        assert event in LIFESPAN_MESSAGES
+        complete, failed = LIFESPAN_MESSAGES[event]
         handlers = getattr(self, f"__{event}__")
 
-        for handler in handlers:
-            try:
-                res = handler()
-                if isawaitable(res):
-                    await res
+        errors: list[Optional[Exception]]
+        if self.concurrent:
+            # Keep the errors in the registration order, not in the completion one
+            errors = [None] * len(handlers)
 
-            except Exception as exc:  # noqa: PERF203
-                self.logger.exception("%s method '%s' raises an exception.", event.title(), handler)
-                if self.ignore_errors:
-                    continue
+            async def run_handler(idx: int, handler: Callable):
+                errors[idx] = await self.__run_handler__(event, handler)
+
+            await aio_wait(*(run_handler(idx, fn) for idx, fn in enumerate(handlers)))
+            errors = [exc for exc in errors if exc is not None]
+
+        else:
+            errors = []
+            for handler in handlers:
+                exc = await self.__run_handler__(event, handler)
+                if exc is not None:
+                    errors.append(exc)
+                    if not self.ignore_errors:
+                        break
+
+        if errors and not self.ignore_errors:
+            self.logger.error("Lifespans process failed", exc_info=errors[0])
+            return {"type": failed, "message": str(errors[0])}
+
+        return {"type": complete}
+
+    async def __run_handler__(self, event: str, handler: Callable) -> Optional[Exception]:
+        """Run a startup/shutdown handler and return its exception (if any)."""
+        try:
+            res = handler()
+            if is_awaitable_result(res):
+                await res
 
-                self.logger.exception("Lifespans process failed")
-                return {"type": f"lifespan.{event}.failed", "message": str(exc)}
+        except Exception as exc:
+            self.logger.exception("%s method '%s' raises an exception.", event.title(), handler)
+            return exc
 
-        return {"type": f"lifespan.{event}.complete"}
+        return None
 
     def on_startup(self, fn: Callable) -> None:
         """Add a function to startup."""
@@ -328,6 +375,8 @@ class RouterMiddleware(BaseMiddeware):
 
     """
 
+    __slots__ = ("router",)
+
     def __init__(self, app: Optional[TASGIApp] = None, router: Optional[Router] = None) -> None:
         """Initialize HTTP router."""
         super().__init__(app)
@@ -340,7 +389,11 @@ class RouterMiddleware(BaseMiddeware):
 
     def __dispatch__(self, scope: TASGIScope) -> tuple[Callable, Optional[Mapping]]:
         """Lookup for a callback."""
-        path = f"{scope.get('root_path', '')}{scope['path']}"
+        path = scope["path"]
+        root_path = scope.get("root_path")
+        if root_path:
+            path = root_path + path
+
         try:
             match = self.router(path, scope["method"])
 
@@ -355,6 +408,10 @@ class RouterMiddleware(BaseMiddeware):
         return self.router.route(*args, **kwargs)
 
 
+# The maximum number of the cached static filepaths
+STATIC_CACHE_SIZE: Final = 1024
+
+
 class StaticFilesMiddleware(BaseMiddeware):
     """Serve static files.
 
@@ -376,7 +433,9 @@ class StaticFilesMiddleware(BaseMiddeware):
 
     """
 
-    scopes = ("http",)
+    __slots__ = "url_prefix", "prefix", "folders", "roots", "cache"
+
+    scopes = frozenset(("http",))
 
     def __init__(
         self,
@@ -387,27 +446,53 @@ class StaticFilesMiddleware(BaseMiddeware):
         """Initialize the middleware."""
         super().__init__(app)
         self.url_prefix = url_prefix
+        # Files are looked up only for paths inside the prefix ("/static/...")
+        self.prefix = url_prefix.rstrip("/") + "/"
         folders = folders or []
         self.folders: list[Path] = [Path(folder) for folder in folders]
+        # (root, root with a trailing separator) pairs of the folders
+        self.roots: tuple[tuple[str, str], ...] = tuple(
+            (root, os.path.join(root, "")) for root in map(os.path.realpath, self.folders)
+        )
+        # Filenames -> the filepaths where they have been found
+        self.cache: dict[str, str] = {}
+
+    def __call__(self, scope: TASGIScope, receive: TASGIReceive, send: TASGISend) -> Awaitable:
+        """Pass requests outside of the url prefix straight to the app."""
+        if scope["type"] in self.scopes and scope["path"].startswith(self.prefix):
+            return self.__process__(scope, receive, send)
+
+        return self.app(scope, receive, send)
 
     async def __process__(self, scope: TASGIScope, receive: TASGIReceive, send: TASGISend) -> None:
         """Serve static files for self url prefix."""
-        path = scope["path"]
-        url_prefix = self.url_prefix
-        if path.startswith(url_prefix):
-            response: Optional[Response] = None
-            filename = path[len(url_prefix) :].strip("/")
-            for folder in self.folders:
-                filepath = folder.joinpath(filename).resolve()
+        response: Optional[Response] = None
+        filename = scope["path"][len(self.prefix) :].strip("/")
+        headers_only = scope["method"] == "HEAD"
+
+        # Skip the folders lookup for the files which have been found already
+        cache = self.cache
+        filepath = cache.get(filename)
+        if filepath is not None:
+            with suppress(ASGIError):
+                response = ResponseFile(filepath, headers_only=headers_only)
+
+        if response is None:
+            for root, root_prefix in self.roots:
+                # Normalize the path without touching the filesystem, and don't leave the root
+                filepath = os.path.normpath(os.path.join(root, filename))
+                if not filepath.startswith(root_prefix):
+                    continue
+
                 with suppress(ASGIError):
-                    response = ResponseFile(filepath, headers_only=scope["method"] == "HEAD")
+                    response = ResponseFile(filepath, headers_only=headers_only)
+                    if len(cache) >= STATIC_CACHE_SIZE:
+                        cache.pop(next(iter(cache)))
+                    cache[filename] = filepath
                     break
 
-            response = response or ResponseError(status_code=404)
-            await response(scope, receive, send)
-
-        else:
-            await self.app(scope, receive, send)
+        response = response or ResponseError(status_code=404)
+        await response(scope, receive, send)
 
 
 BACKGROUND_TASK: Final = ContextVar[Optional[Awaitable]]("background_task", default=None)
@@ -436,14 +521,45 @@ class BackgroundMiddleware(BaseMiddeware):
 
     """
 
+    __slots__ = ()
+
     async def __process__(self, scope: TASGIScope, receive: TASGIReceive, send: TASGISend):
         """Run background tasks."""
         await self.app(scope, receive, send)
         bgtask = BACKGROUND_TASK.get()
-        if bgtask is not None and isawaitable(bgtask):
+        if bgtask is not None and is_awaitable_result(bgtask):
             await bgtask
 
     @staticmethod
     def set_task(task: Awaitable):
         """Set a task for background execution."""
         BACKGROUND_TASK.set(task)
+
+
+def install_uvloop() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Use uvloop_ as the asyncio event loop (if it is installed).
+
+    .. code-block:: python
+
+        import asyncio
+
+        from asgi_tools.middleware import install_uvloop
+
+        loop_factory = install_uvloop()
+
+        # Python 3.14+ deprecates event loop policies, pass the factory instead
+        asyncio.run(main(), loop_factory=loop_factory)
+
+    On Python < 3.14 the uvloop policy is set as well.
+
+    :return: uvloop's loop factory, or ``None`` if uvloop is not installed
+    """
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    if sys.version_info < (3, 14):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    return uvloop.new_event_loop
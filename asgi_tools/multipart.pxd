@@ -30,5 +30,3 @@ cdef class MultipartParser(BaseParser):
     cdef int header_value_pos
     cdef int part_data_pos
     cdef bytes boundary
-    cdef frozenset boundary_chars
-    cdef list lookbehind
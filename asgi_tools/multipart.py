@@ -6,8 +6,6 @@ The original code is licensed by Apache2 license.
 
 from __future__ import annotations
 
-from contextlib import suppress
-
 # Flags for the multipart parser.
 from typing import Final
 
@@ -25,7 +23,10 @@ HYPHEN: Final = b"-"[0]
 LF: Final = b"\n"[0]
 SEMICOLON: Final = b";"[0]
 SPACE: Final = b" "[0]
-EMPTY: Final = b"\x00"[0]
+
+# Bitmaps of the separators, tested with (BITMAP >> ch) & 1
+QS_SEPARATORS: Final = (1 << AMPERSAND) | (1 << SEMICOLON)
+NEWLINES: Final = (1 << CR) | (1 << LF)
 
 
 class BaseParser:
@@ -54,9 +55,11 @@ class BaseParser:
         self.callbacks = callbacks
 
     def callback(self, name: str, data: bytes, start: int, end: int):
-        with suppress(KeyError):
-            func = self.callbacks[name]
-            func(data, start, end)
+        # A plain try/except is much cheaper than contextlib.suppress for every callback
+        try:  # noqa: SIM105
+            self.callbacks[name](data, start, end)
+        except KeyError:  # noqa: S110
+            pass
 
     def write(self, _: bytes):
         pass
@@ -114,19 +117,24 @@ class QueryStringParser(BaseParser):
 
     def write(self, data: bytes):  # noqa: C901, PLR0912
         data_len = prune_data(len(data), self.cursize, self.max_size)
+        callback = self.callback
 
         idx = 0
         state = self.state
 
         while idx < data_len:
-            ch = data[idx]
             if state == STATE_BEFORE_FIELD:
-                if ch not in (AMPERSAND, SEMICOLON):
-                    self.callback("field_start", b"", 0, 0)
-                    idx -= 1
+                # Skip the separators at once and start the field in place
+                while idx < data_len and (QS_SEPARATORS >> data[idx]) & 1:
+                    idx += 1
+
+                if idx < data_len:
+                    callback("field_start", b"", 0, 0)
                     state = STATE_FIELD_NAME
 
-            elif state == STATE_FIELD_NAME:
+                continue
+
+            if state == STATE_FIELD_NAME:
                 sep_pos = data.find(AMPERSAND, idx)
                 if sep_pos == -1:
                     sep_pos = data.find(SEMICOLON, idx)
@@ -137,17 +145,17 @@ class QueryStringParser(BaseParser):
                     equals_pos = data.find(EQUAL, idx)
 
                 if equals_pos != -1:
-                    self.callback("field_name", data, idx, equals_pos)
+                    callback("field_name", data, idx, equals_pos)
                     idx = equals_pos
                     state = STATE_FIELD_DATA
 
                 elif sep_pos == -1:
-                    self.callback("field_name", data, idx, data_len)
+                    callback("field_name", data, idx, data_len)
                     idx = data_len
 
                 else:
-                    self.callback("field_name", data, idx, sep_pos)
-                    self.callback("field_end", b"", 0, 0)
+                    callback("field_name", data, idx, sep_pos)
+                    callback("field_end", b"", 0, 0)
                     idx = sep_pos - 1
                     state = STATE_BEFORE_FIELD
 
@@ -157,12 +165,12 @@ class QueryStringParser(BaseParser):
                     sep_pos = data.find(SEMICOLON, idx)
 
                 if sep_pos == -1:
-                    self.callback("field_data", data, idx, data_len)
+                    callback("field_data", data, idx, data_len)
                     idx = data_len
 
                 else:
-                    self.callback("field_data", data, idx, sep_pos)
-                    self.callback("field_end", b"", 0, 0)
+                    callback("field_data", data, idx, sep_pos)
+                    callback("field_end", b"", 0, 0)
 
                     idx = sep_pos - 1
                     state = STATE_BEFORE_FIELD
@@ -266,8 +274,6 @@ class MultipartParser(BaseParser):
         "header_value_pos",
         "part_data_pos",
         "boundary",
-        "boundary_chars",
-        "lookbehind",
     )
 
     def __init__(self, boundary, callbacks: dict, max_size: int = 0):
@@ -286,17 +292,9 @@ class MultipartParser(BaseParser):
 
         self.boundary = b"\r\n--" + boundary
 
-        # Get a set of characters that belong to our boundary.
-        self.boundary_chars = frozenset(self.boundary)
-
-        # We also create a lookbehind list.
-        # Note: the +8 is since we can have, at maximum, "\r\n--" + boundary +
-        # "--\r\n" at the final boundary, and the length of '\r\n--' and
-        # '--\r\n' is 8 bytes.
-        self.lookbehind = [EMPTY for _ in range(len(boundary) + 8)]
-
     def write(self, data):  # noqa: C901, PLR0912, PLR0915
         data_len = prune_data(len(data), self.cursize, self.max_size)
+        callback = self.callback
 
         idx = 0
         index = self.index
@@ -304,6 +302,8 @@ class MultipartParser(BaseParser):
         flags = self.flags
         boundary = self.boundary
         boundary_len = len(boundary)
+        # Bind the search once per chunk, the boundary is looked up for every part
+        find = data.find
 
         while idx < data_len:
             ch = data[idx]
@@ -321,7 +321,7 @@ class MultipartParser(BaseParser):
                         raise ValueError(f"Did not find \\n at end of boundary ({idx})")
 
                     state = STATE_HEADER_FIELD_START
-                    self.callback("part_begin", b"", 0, 0)
+                    callback("part_begin", b"", 0, 0)
 
                 # Check to ensure our boundary matches
                 elif ch == boundary[index + 2]:
@@ -342,6 +342,20 @@ class MultipartParser(BaseParser):
                 state = STATE_HEADER_FIELD
 
             elif state == STATE_HEADER_FIELD:
+                # Jump to the next colon or CR, the bytes before are a part of the field
+                colon_pos = find(COLON, idx, data_len)
+                cr_pos = find(CR, idx, data_len if colon_pos == -1 else colon_pos)
+                if cr_pos == -1:
+                    if colon_pos == -1:
+                        index += data_len - idx
+                        break
+
+                    cr_pos = colon_pos
+
+                index += cr_pos - idx
+                idx = cr_pos
+                ch = data[idx]
+
                 # If we've reached a CR at the beginning of a header, it means
                 # that we've reached the second of 2 newlines, and so there are
                 # no more headers to parse.
@@ -361,7 +375,7 @@ class MultipartParser(BaseParser):
 
                     # Call our callback with the header field.
                     if self.header_field_pos != -1:
-                        self.callback("header_field", data, self.header_field_pos, idx)
+                        callback("header_field", data, self.header_field_pos, idx)
                         self.header_field_pos = -1
 
                     # Move to parsing the header value.
@@ -377,15 +391,18 @@ class MultipartParser(BaseParser):
                     state = STATE_HEADER_VALUE
 
             elif state == STATE_HEADER_VALUE:
-                # If we've got a CR, we're nearly done our headers.  Otherwise,
-                # we do nothing and just move past this character.
-                if ch == CR:
-                    if self.header_value_pos != -1:
-                        self.callback("header_value", data, self.header_value_pos, idx)
-                        self.header_value_pos = -1
+                # Jump to the next CR, we're nearly done our headers then.  The
+                # bytes before are a part of the value.
+                idx = find(CR, idx, data_len)
+                if idx == -1:
+                    break
 
-                    self.callback("header_end", b"", 0, 0)
-                    state = STATE_HEADER_VALUE_ALMOST_DONE
+                if self.header_value_pos != -1:
+                    callback("header_value", data, self.header_value_pos, idx)
+                    self.header_value_pos = -1
+
+                callback("header_end", b"", 0, 0)
+                state = STATE_HEADER_VALUE_ALMOST_DONE
 
             elif state == STATE_HEADER_VALUE_ALMOST_DONE:
                 # The last character should be a LF.  If not, it's an error.
@@ -408,7 +425,7 @@ class MultipartParser(BaseParser):
                         f"Did not find \\n at end of headers (found {ch:c})",
                     )
 
-                self.callback("headers_finished", b"", 0, 0)
+                callback("headers_finished", b"", 0, 0)
                 # Mark the start of our part data.
                 self.part_data_pos = idx + 1
                 state = STATE_PART_DATA
@@ -417,32 +434,26 @@ class MultipartParser(BaseParser):
                 # We're processing our part data right now.  During this, we
                 # need to efficiently search for our boundary, since any data
                 # on any number of lines can be a part of the current data.
-                # We use the Boyer-Moore-Horspool algorithm to efficiently
-                # search through the remainder of the buffer looking for our
-                # boundary.
+                # We use bytes.find (a native fast search) to jump straight to
+                # the next boundary candidate in the remainder of the buffer.
 
                 # Save the current value of our index.  We use this in case we
                 # find part of a boundary, but it doesn't match fully.
                 prev_index = index
 
-                # Set up variables.
-                boundary_end = boundary_len - 1
-                boundary_chars = self.boundary_chars
-
                 # If our index is 0, we're starting a new part, so start our
                 # search.
                 if index == 0:
-                    # Search forward until we either hit the end of our buffer,
-                    # or reach a character that's in our boundary.
-                    idx += boundary_end
-                    while idx < data_len - 1 and data[idx] not in boundary_chars:
-                        idx += boundary_len
-
-                    # Reset i back the length of our boundary, which is the
-                    # earliest possible location that could be our match (i.e.
-                    # if we've just broken out of our loop since we saw the
-                    # last character in our boundary)
-                    idx -= boundary_end
+                    boundary_pos = find(boundary, idx, data_len)
+                    if boundary_pos == -1:
+                        # Only a part of the boundary can be at the end of the
+                        # buffer, and it has to start with CR.
+                        boundary_pos = find(CR, max(idx, data_len - boundary_len + 1), data_len)
+                        if boundary_pos == -1:
+                            # No boundary here, the rest of the buffer is data
+                            break
+
+                    idx = boundary_pos
                     ch = data[idx]
 
                 # Now, we have a couple of cases here.  If our index is before
@@ -453,7 +464,7 @@ class MultipartParser(BaseParser):
                         # If we found a match for our boundary, we send the
                         # existing data.
                         if index == 0 and self.part_data_pos != -1:
-                            self.callback("part_data", data, self.part_data_pos, idx)
+                            callback("part_data", data, self.part_data_pos, idx)
                             self.part_data_pos = -1
 
                         # The current character matches, so continue!
@@ -469,7 +480,7 @@ class MultipartParser(BaseParser):
                     # Now, if we've reached a newline, we need to set this as
                     # the potential end of our boundary.
                     if ch == CR:
-                        flags |= FLAG_PART_BOUNDARY
+                        flags = (flags | FLAG_PART_BOUNDARY) & ~FLAG_LAST_BOUNDARY
 
                     # Otherwise, if this is a hyphen, we might be at the last
                     # of all boundaries.
@@ -494,8 +505,8 @@ class MultipartParser(BaseParser):
 
                             # Callback indicating that we've reached the end of
                             # a part, and are starting a new one.
-                            self.callback("part_end", b"", 0, 0)
-                            self.callback("part_begin", b"", 0, 0)
+                            callback("part_end", b"", 0, 0)
+                            callback("part_begin", b"", 0, 0)
 
                             # Move to parsing new headers.
                             index = 0
@@ -515,26 +526,24 @@ class MultipartParser(BaseParser):
                         if ch == HYPHEN:
                             # Callback to end the current part, and then the
                             # message.
-                            self.callback("part_end", b"", 0, 0)
-                            self.callback("end", b"", 0, 0)
+                            callback("part_end", b"", 0, 0)
+                            callback("end", b"", 0, 0)
                             state = STATE_END
                         else:
                             # No match, so reset index.
                             index = 0
 
-                # If we have an index, we need to keep this byte for later, in
-                # case we can't match the full boundary.
-                if index > 0:
-                    self.lookbehind[index - 1] = ch
-
-                # Otherwise, our index is 0.  If the previous index is not, it
-                # means we reset something, and we need to take the data we
-                # thought was part of our boundary and send it along as actual
-                # data.
-                elif prev_index > 0:
+                # If our index is 0 and the previous index is not, it means we
+                # reset something, and we need to take the data we thought was
+                # part of our boundary and send it along as actual data.  The
+                # data is the boundary itself (and the CR or hyphen after it).
+                if index == 0 and prev_index > 0:
                     # Callback to write the saved data.
-                    lb_data = bytes(self.lookbehind)
-                    self.callback("part_data", lb_data, 0, prev_index)
+                    if prev_index > boundary_len:
+                        lb_data = boundary + (b"-" if flags & FLAG_LAST_BOUNDARY else b"\r")
+                    else:
+                        lb_data = boundary[:prev_index]
+                    callback("part_data", lb_data, 0, prev_index)
 
                     # Overwrite our previous index.
                     prev_index = 0
@@ -548,15 +557,15 @@ class MultipartParser(BaseParser):
 
             elif state == STATE_START:
                 # Skip leading newlines
-                if ch not in (CR, LF):
+                if not (NEWLINES >> ch) & 1:
                     # Move to the next state, but decrement i so that we re-process
                     # this character.
                     idx -= 1
                     state = STATE_START_BOUNDARY
 
             elif state == STATE_END:
-                # Do nothing and just consume a byte in the end state.
-                pass
+                # Nothing is parsed after the last boundary, skip the rest at once
+                break
 
             else:
                 raise ValueError(f"Reached an unknown state {state} at {idx}")
@@ -565,15 +574,15 @@ class MultipartParser(BaseParser):
             idx += 1
 
         if self.header_field_pos != -1:
-            self.callback("header_field", data, self.header_field_pos, data_len)
+            callback("header_field", data, self.header_field_pos, data_len)
             self.header_field_pos = 0
 
         if self.header_value_pos != -1:
-            self.callback("header_value", data, self.header_value_pos, data_len)
+            callback("header_value", data, self.header_value_pos, data_len)
             self.header_value_pos = 0
 
         if self.part_data_pos != -1:
-            self.callback("part_data", data, self.part_data_pos, data_len)
+            callback("part_data", data, self.part_data_pos, data_len)
             self.part_data_pos = 0
 
         self.index = index
@@ -18,7 +18,6 @@ cdef char HYPHEN = b'-'
 cdef char LF = b'\n'
 cdef char SEMICOLON = b';'
 cdef char SPACE = b' '
-cdef char EMPTY = b'\x00'
 
 
 cdef class BaseParser:
@@ -110,15 +109,21 @@ cdef class QueryStringParser(BaseParser):
         cdef int sep_pos, equals_pos
 
         while idx < data_len:
-            ch = data[idx]
             if state == STATE_BEFORE_FIELD:
+                # Skip the separators at once and start the field in place
+                while idx < data_len:
+                    ch = data[idx]
+                    if not (ch == AMPERSAND or ch == SEMICOLON):
+                        break
+                    idx += 1
 
-                if not (ch == AMPERSAND or ch == SEMICOLON):
+                if idx < data_len:
                     self.callback('field_start', b'', 0, 0)
-                    idx -= 1
                     state = STATE_FIELD_NAME
 
-            elif state == STATE_FIELD_NAME:
+                continue
+
+            if state == STATE_FIELD_NAME:
                 sep_pos = data.find(AMPERSAND, idx)
                 if sep_pos == -1:
                     sep_pos = data.find(SEMICOLON, idx)
@@ -262,15 +267,6 @@ cdef class MultipartParser(BaseParser):
 
         self.boundary = b'\r\n--' + boundary
 
-        # Get a set of characters that belong to our boundary.
-        self.boundary_chars = frozenset(self.boundary)
-
-        # We also create a lookbehind list.
-        # Note: the +8 is since we can have, at maximum, "\r\n--" + boundary +
-        # "--\r\n" at the final boundary, and the length of '\r\n--' and
-        # '--\r\n' is 8 bytes.
-        self.lookbehind = [EMPTY for x in range(len(boundary) + 8)]
-
     cpdef void write(self, bytes data) except *:  # noqa
         cdef int data_len = prune_data(len(data), self.cursize, self.max_size)
 
@@ -279,9 +275,11 @@ cdef class MultipartParser(BaseParser):
         cdef unsigned char state = self.state
         cdef short flags = self.flags
         cdef bytes boundary = self.boundary
-        cdef unsigned int boundary_len = len(boundary)
+        cdef int boundary_len = len(boundary)
+        # Bind the search once per chunk, the boundary is looked up for every part
+        find = data.find
         cdef char ch
-        cdef int boundary_end, prev_index
+        cdef int boundary_pos, prev_index, colon_pos, cr_pos
 
         while idx < data_len:
             ch = data[idx]
@@ -318,6 +316,20 @@ cdef class MultipartParser(BaseParser):
                 state = STATE_HEADER_FIELD
 
             elif state == STATE_HEADER_FIELD:
+                # Jump to the next colon or CR, the bytes before are a part of the field
+                colon_pos = find(COLON, idx, data_len)
+                cr_pos = find(CR, idx, data_len if colon_pos == -1 else colon_pos)
+                if cr_pos == -1:
+                    if colon_pos == -1:
+                        index += data_len - idx
+                        break
+
+                    cr_pos = colon_pos
+
+                index += cr_pos - idx
+                idx = cr_pos
+                ch = data[idx]
+
                 # If we've reached a CR at the beginning of a header, it means
                 # that we've reached the second of 2 newlines, and so there are
                 # no more headers to parse.
@@ -353,15 +365,18 @@ cdef class MultipartParser(BaseParser):
                     state = STATE_HEADER_VALUE
 
             elif state == STATE_HEADER_VALUE:
-                # If we've got a CR, we're nearly done our headers.  Otherwise,
-                # we do nothing and just move past this character.
-                if ch == CR:
-                    if self.header_value_pos != -1:
-                        self.callback('header_value', data, self.header_value_pos, idx)
-                        self.header_value_pos = -1
+                # Jump to the next CR, we're nearly done our headers then.  The
+                # bytes before are a part of the value.
+                idx = find(CR, idx, data_len)
+                if idx == -1:
+                    break
+
+                if self.header_value_pos != -1:
+                    self.callback('header_value', data, self.header_value_pos, idx)
+                    self.header_value_pos = -1
 
-                    self.callback('header_end', b'', 0, 0)
-                    state = STATE_HEADER_VALUE_ALMOST_DONE
+                self.callback('header_end', b'', 0, 0)
+                state = STATE_HEADER_VALUE_ALMOST_DONE
 
             elif state == STATE_HEADER_VALUE_ALMOST_DONE:
                 # The last character should be a LF.  If not, it's an error.
@@ -389,32 +404,26 @@ cdef class MultipartParser(BaseParser):
                 # We're processing our part data right now.  During this, we
                 # need to efficiently search for our boundary, since any data
                 # on any number of lines can be a part of the current data.
-                # We use the Boyer-Moore-Horspool algorithm to efficiently
-                # search through the remainder of the buffer looking for our
-                # boundary.
+                # We use bytes.find (a native fast search) to jump straight to
+                # the next boundary candidate in the remainder of the buffer.
 
                 # Save the current value of our index.  We use this in case we
                 # find part of a boundary, but it doesn't match fully.
                 prev_index = index
 
-                # Set up variables.
-                boundary_end = boundary_len - 1
-                boundary_chars = self.boundary_chars
-
                 # If our index is 0, we're starting a new part, so start our
                 # search.
                 if index == 0:
-                    # Search forward until we either hit the end of our buffer,
-                    # or reach a character that's in our boundary.
-                    idx += boundary_end
-                    while idx < data_len - 1 and data[idx] not in boundary_chars:
-                        idx += boundary_len
-
-                    # Reset i back the length of our boundary, which is the
-                    # earliest possible location that could be our match (i.e.
-                    # if we've just broken out of our loop since we saw the
-                    # last character in our boundary)
-                    idx -= boundary_end
+                    boundary_pos = find(boundary, idx, data_len)
+                    if boundary_pos == -1:
+                        # Only a part of the boundary can be at the end of the
+                        # buffer, and it has to start with CR.
+                        boundary_pos = find(CR, max(idx, data_len - boundary_len + 1), data_len)
+                        if boundary_pos == -1:
+                            # No boundary here, the rest of the buffer is data
+                            break
+
+                    idx = boundary_pos
                     ch = data[idx]
 
                 # Now, we have a couple of cases here.  If our index is before
@@ -441,7 +450,7 @@ cdef class MultipartParser(BaseParser):
                     # Now, if we've reached a newline, we need to set this as
                     # the potential end of our boundary.
                     if ch == CR:
-                        flags |= FLAG_PART_BOUNDARY
+                        flags = (flags | FLAG_PART_BOUNDARY) & ~FLAG_LAST_BOUNDARY
 
                     # Otherwise, if this is a hyphen, we might be at the last
                     # of all boundaries.
@@ -494,18 +503,16 @@ cdef class MultipartParser(BaseParser):
                             # No match, so reset index.
                             index = 0
 
-                # If we have an index, we need to keep this byte for later, in
-                # case we can't match the full boundary.
-                if index > 0:
-                    self.lookbehind[index - 1] = ch
-
-                # Otherwise, our index is 0.  If the previous index is not, it
-                # means we reset something, and we need to take the data we
-                # thought was part of our boundary and send it along as actual
-                # data.
-                elif prev_index > 0:
+                # If our index is 0 and the previous index is not, it means we
+                # reset something, and we need to take the data we thought was
+                # part of our boundary and send it along as actual data.  The
+                # data is the boundary itself (and the CR or hyphen after it).
+                if index == 0 and prev_index > 0:
                     # Callback to write the saved data.
-                    lb_data = bytes(self.lookbehind)
+                    if prev_index > boundary_len:
+                        lb_data = boundary + (b'-' if flags & FLAG_LAST_BOUNDARY else b'\r')
+                    else:
+                        lb_data = boundary[:prev_index]
                     self.callback('part_data', lb_data, 0, prev_index)
 
                     # Overwrite our previous index.
@@ -528,8 +535,8 @@ cdef class MultipartParser(BaseParser):
                     state = STATE_START_BOUNDARY
 
             elif state == STATE_END:
-                # Do nothing and just consume a byte in the end state.
-                pass
+                # Nothing is parsed after the last boundary, skip the rest at once
+                break
 
             else:
                 raise ValueError(f"Reached an unknown state {state} at {idx}")
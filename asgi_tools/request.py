@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterator, Optio
 from yarl import URL
 
 from ._compat import json_loads
-from .constants import DEFAULT_CHARSET
+from .constants import BASE_ENCODING, DEFAULT_CHARSET
 from .errors import ASGIDecodeError
 from .forms import read_formdata
 from .types import TJSON, TASGIReceive, TASGIScope, TASGISend
@@ -115,7 +115,7 @@ class Request(TASGIScope):
         """
         if self._url is None:
             scope = self.scope
-            host = self.headers.get("host")
+            host = self._header("host")
             if host is None:
                 if "server" in scope:
                     host, port = scope["server"]
@@ -153,6 +153,21 @@ class Request(TASGIScope):
             self._headers = parse_headers(self.scope["headers"])
         return self._headers
 
+    def _header(self, name: str) -> Optional[str]:
+        """Get the first value of the given header (lowercased name).
+
+        The scope's headers are scanned directly while :attr:`headers` haven't been parsed.
+        """
+        if self._headers is not None:
+            return self._headers.get(name)
+
+        bname = name.encode(BASE_ENCODING)
+        for key, value in self.scope["headers"]:
+            if key.lower() == bname:
+                return value.decode(BASE_ENCODING)
+
+        return None
+
     @property
     def cookies(self) -> dict[str, str]:
         """A lazy property that parses the current scope's cookies and returns a dictionary.
@@ -164,12 +179,18 @@ class Request(TASGIScope):
 
         """
         if self._cookies is None:
-            self._cookies = {}
-            cookie = self.headers.get("cookie")
+            result: dict[str, str] = {}
+            cookie = self._header("cookie")
             if cookie:
                 for chunk in cookie.split(";"):
                     key, _, val = chunk.partition("=")
-                    self._cookies[key.strip()] = cookies._unquote(val.strip())
+                    val = val.strip()
+                    # Only quoted values need to be unquoted
+                    if val[:1] == '"':
+                        val = cookies._unquote(val)
+                    result[key.strip()] = val
+
+            self._cookies = result
 
         return self._cookies
 
@@ -177,7 +198,7 @@ class Request(TASGIScope):
     def media(self) -> dict[str, str]:
         """Prepare a media data for the request."""
         if self._media is None:
-            conten_type_header = self.headers.get("content-type", "")
+            conten_type_header = self._header("content-type") or ""
             content_type, opts = parse_options_header(conten_type_header)
             self._media = dict(opts, content_type=content_type)
 
@@ -302,16 +323,17 @@ class Request(TASGIScope):
         Returns data from :py:meth:`json` for `application/json`, :py:meth:`form` for
         `application/x-www-form-urlencoded`,  `multipart/form-data` and :py:meth:`text` otherwise.
         """
+        content_type = self.content_type
         try:
-            if self.content_type in {
+            if content_type == "application/json":
+                return await self.json()
+
+            if content_type in {
                 "application/x-www-form-urlencoded",
                 "multipart/form-data",
             }:
                 return await self.form()
 
-            if self.content_type == "application/json":
-                return await self.json()
-
         except ASGIDecodeError:
             if raise_errors:
                 raise
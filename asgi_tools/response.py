@@ -258,6 +258,8 @@ class ResponseFile(ResponseStream):
             empty() if headers_only else aio_stream_file(filepath, chunk_size),
             **kwargs,
         )
+        # The absolute filepath to send with the "http.response.pathsend" extension
+        self.filepath = None if headers_only else str(Path(filepath).absolute())
 
         headers = self.headers
         if filename and "content-disposition" not in headers:
@@ -271,6 +273,15 @@ class ResponseFile(ResponseStream):
         etag = str(stat.st_mtime) + "-" + str(stat.st_size)
         headers.setdefault("etag", md5(etag.encode()).hexdigest())  # noqa: S324
 
+    async def __call__(self, scope, receive, send: TASGISend) -> None:
+        """Let the server send the file when it supports the pathsend extension."""
+        if self.filepath and scope and "http.response.pathsend" in (scope.get("extensions") or {}):
+            await send(self.msg_start())
+            await send({"type": "http.response.pathsend", "path": self.filepath})
+            return
+
+        await super().__call__(scope, receive, send)
+
 
 class ResponseWebSocket(Response):
     """A helper to work with websockets.
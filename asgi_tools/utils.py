@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import re
 from functools import wraps
-from inspect import isasyncgenfunction, iscoroutinefunction
-from typing import TYPE_CHECKING, Callable, Coroutine, overload
+from inspect import isasyncgenfunction, isawaitable, iscoroutinefunction
+from types import CoroutineType
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Final, overload
 from urllib.parse import unquote_to_bytes
 
 from multidict import CIMultiDict
@@ -21,6 +22,19 @@ def is_awaitable(fn: Callable) -> bool:
     return iscoroutinefunction(fn) or isasyncgenfunction(fn)
 
 
+# Known results of the awaitable checks for the most common types (never extended)
+AWAITABLE_TYPES: Final[dict[type, bool]] = {CoroutineType: True, type(None): False}
+
+
+def is_awaitable_result(obj: Any) -> bool:
+    """Check that the given object is awaitable (a fast path for coroutines and None)."""
+    res = AWAITABLE_TYPES.get(type(obj))
+    if res is None:
+        return isawaitable(obj)
+
+    return res
+
+
 @overload
 def to_awaitable(fn: TVAsyncCallable) -> TVAsyncCallable: ...
 
@@ -79,6 +93,9 @@ OPTION_HEADER_PIECE_RE = re.compile(
     flags=re.VERBOSE,
 )
 
+# Options with these chars are parsed with the regexp above
+OPTION_HEADER_SPECIAL_RE = re.compile(r'["*,\\]')
+
 
 def parse_options_header(value: str) -> tuple[str, dict[str, str]]:
     """Parse the given content disposition header."""
@@ -91,6 +108,21 @@ def parse_options_header(value: str) -> tuple[str, dict[str, str]]:
         return value, options
 
     ctype, rest = value.split(";", 1)
+
+    # Simple options ("text/html; charset=utf-8") are parsed by splitting
+    if not OPTION_HEADER_SPECIAL_RE.search(rest):
+        for piece in rest.split(";"):
+            key, _, val = piece.partition("=")
+            key, val = key.strip(), val.lstrip().rstrip(" ")
+            if not (key and val) or len(key.split()) > 1:
+                options.clear()
+                break
+
+            options[key] = val
+
+        else:
+            return ctype, options
+
     while rest:
         match = OPTION_HEADER_PIECE_RE.match(rest)
         if not match:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import tempfile
+from io import BufferedRandom
 from pathlib import Path
 
 import pytest
@@ -43,6 +44,30 @@ async def test_formdata(gen_request, tmp_path):
     assert b"test_multipart_parser" in formdata["file2"].read()
 
 
+async def test_formdata_upload_to(gen_request, tmp_path):
+    from asgi_tools.forms import read_formdata
+    from asgi_tools.tests import encode_multipart
+
+    content = Path(__file__).read_bytes() * 4
+    with open(__file__) as f:
+        data, content_type = encode_multipart({"file": f})
+    data = data.replace(Path(__file__).read_bytes(), content)
+    body = [data[n : n + 7] for n in range(0, len(data), 7)]
+    request = gen_request(body=body, headers={"content-type": content_type})
+    formdata = await read_formdata(request, 0, lambda f: f"{tmp_path}/{f}", 0)
+    upload = formdata["file"]
+    assert isinstance(upload, BufferedRandom)
+    assert upload.content_type == "text/x-python"
+    assert upload.readline() == content.split(b"\n", 1)[0] + b"\n"
+    upload.seek(0)
+    assert upload.read() == content
+
+    # The upload is a regular buffered file
+    upload.write(b"#")
+    upload.close()
+    assert (tmp_path / Path(__file__).name).read_bytes() == content + b"#"
+
+
 @pytest.mark.parametrize(
     "sample",
     [
@@ -123,6 +148,26 @@ def test_multipart(basename, gen_request):
             assert data == expected["data"]
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16])
+def test_multipart_parser_small_chunks(chunk_size):
+    from asgi_tools.multipart import MultipartParser
+
+    data, meta = loader("multiple_files")
+    parts: list[bytearray] = []
+    parser = MultipartParser(
+        meta["boundary"],
+        {
+            "part_begin": lambda *_: parts.append(bytearray()),
+            "part_data": lambda data, start, end: parts[-1].extend(data[start:end]),
+        },
+    )
+    for n in range(0, len(data), chunk_size):
+        parser.write(data[n : n + chunk_size])
+    parser.finalize()
+
+    assert parts == [expected["data"] for expected in meta["expected"]]
+
+
 # Utils
 # -----
 
@@ -127,6 +127,46 @@ async def test_lifespan_middleware_errors(client_cls):
     assert side_effects["finished"]
 
 
+async def test_lifespan_middleware_concurrent(client_cls, caplog):
+    from asgi_tools import LifespanMiddleware
+    from asgi_tools._compat import aio_sleep
+
+    side_effects = []
+
+    async def slow():
+        await aio_sleep(1e-2)
+        side_effects.append("slow")
+
+    async def fast():
+        side_effects.append("fast")
+
+    app = LifespanMiddleware(
+        lambda scope, receive, send: None,
+        concurrent=True,
+        on_startup=[slow, fast],
+    )
+    client = client_cls(app)
+
+    async with client.lifespan():
+        assert side_effects == ["fast", "slow"]
+
+    async def fail_slow():
+        await aio_sleep(1e-2)
+        raise Exception("fail slow")
+
+    async def fail():
+        raise Exception("fail")
+
+    # The first failed handler is reported, whatever finishes first
+    app.on_startup(fail_slow)
+    app.on_startup(fail)
+    assert await app.run("startup") == {
+        "type": "lifespan.startup.failed",
+        "message": "fail slow",
+    }
+    assert caplog.records[-1].exc_info[1].args == ("fail slow",)
+
+
 async def test_router_middleware(client_cls):
     from asgi_tools import Response, RouterMiddleware
 
@@ -162,6 +202,28 @@ async def test_router_middleware(client_cls):
     assert res.status_code == 200
     assert await res.text() == "page2: 42"
 
+    res = await client.post("/page2/24")
+    assert await res.text() == "page2: 24"
+
+    # Routes registered on the router itself are visible at once
+    res = await client.get("/page3")
+    assert res.status_code == 404
+
+    res = await client.post("/page2/static")
+    assert await res.text() == "page2: static"
+
+    @app.router.route("/page3", "/page2/static", methods=["GET", "POST"])
+    async def page3(scope, receive, send):
+        res = Response("page3")
+        return await res(scope, receive, send)
+
+    res = await client.get("/page3")
+    assert res.status_code == 200
+    assert await res.text() == "page3"
+
+    res = await client.post("/page2/static")
+    assert await res.text() == "page3"
+
 
 async def test_router_middleware2(client_cls):
     from asgi_tools import ResponseError, ResponseMiddleware, RouterMiddleware
@@ -215,6 +277,42 @@ async def test_staticfiles_middleware(client_cls, app):
     res = await client.get("/static")
     assert res.status_code == 404
 
+    # Files outside of the folders are not served
+    client = client_cls(StaticFilesMiddleware(app, folders=[Path(__file__).parent]))
+    assert (Path(__file__).parent.parent / "README.rst").exists()
+    res = await client.get("/static/../README.rst")
+    assert res.status_code == 404
+
+
+async def test_staticfiles_middleware_changes(client_cls, app, tmp_path):
+    from asgi_tools import StaticFilesMiddleware
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "file.txt").write_text("v1")
+
+    client = client_cls(StaticFilesMiddleware(app, folders=[first, second]))
+    res = await client.get("/static/file.txt")
+    assert res.status_code == 200
+    assert await res.text() == "v1"
+
+    # A replaced file is served with its new content
+    (first / "file.txt").write_text("version 2")
+    res = await client.get("/static/file.txt")
+    assert await res.text() == "version 2"
+
+    # A removed file is looked up in the other folders again
+    (first / "file.txt").unlink()
+    (second / "file.txt").write_text("v3")
+    res = await client.get("/static/file.txt")
+    assert res.status_code == 200
+    assert await res.text() == "v3"
+
+    (second / "file.txt").unlink()
+    res = await client.get("/static/file.txt")
+    assert res.status_code == 404
+
 
 async def test_background_middleware(client_cls, app):
     from asgi_tools import BackgroundMiddleware, ResponseText, RouterMiddleware
@@ -239,3 +337,22 @@ async def test_background_middleware(client_cls, app):
     res = await client.get("/test")
     assert res.status_code == 200
     assert results == ["test1"]
+
+
+def test_install_uvloop():
+    import asyncio
+    import sys
+
+    from asgi_tools.middleware import install_uvloop
+
+    uvloop = pytest.importorskip("uvloop")
+    if sys.version_info >= (3, 14):
+        assert install_uvloop() is uvloop.new_event_loop
+        return
+
+    policy = asyncio.get_event_loop_policy()
+    try:
+        assert install_uvloop() is uvloop.new_event_loop
+        assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(policy)
@@ -71,11 +71,18 @@ async def test_media(gen_request):
 
     req = gen_request(headers={"content-type": "text/html; charset=iso-8859-1"})
     assert req.media
+    # The headers are not parsed to get the content type only
+    assert req._headers is None
     assert req.media["charset"]
     assert req.media["content_type"]
     assert req.content_type == "text/html"
 
 
+async def test_cookies(gen_request):
+    req = gen_request(headers={"cookie": 'session=test-session; name="a\\"b"; flag'})
+    assert req.cookies == {"session": "test-session", "name": 'a"b', "flag": ""}
+
+
 async def test_body(gen_request):
     req = gen_request(body=[b"any"])
     body = await req.body()
@@ -217,6 +217,32 @@ async def test_file_response():
     with pytest.raises(ASGIError):
         response = ResponseFile("unknown")
 
+    # Servers with the pathsend extension send the file themselves
+    from pathlib import Path
+
+    from asgi_tools.utils import to_awaitable
+
+    messages = []
+    response = ResponseFile(__file__)
+    scope = {"type": "http", "extensions": {"http.response.pathsend": {}}}
+    await response(scope, None, to_awaitable(messages.append))
+    assert len(messages) == 2
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[1] == {
+        "type": "http.response.pathsend",
+        "path": str(Path(__file__).absolute()),
+    }
+
+    # Some servers send the extensions as None
+    from functools import partial
+
+    from asgi_tools._compat import aio_sleep
+
+    messages = []
+    scope = {"type": "http", "extensions": None}
+    await response(scope, partial(aio_sleep, 10), to_awaitable(messages.append))
+    assert messages[-1]["type"] == "http.response.body"
+
 
 async def test_sse_response(client_cls):
     from asgi_tools import ResponseSSE
@@ -14,6 +14,10 @@ def test_parse_options_header():
     assert ct == "form-data"
     assert opts == {"name": "test_client.py", "filename": "test_client.py"}
 
+    ct, opts = parse_options_header("multipart/form-data; charset=utf-8;boundary = --xyz ")
+    assert ct == "multipart/form-data"
+    assert opts == {"charset": "utf-8", "boundary": "--xyz"}
+
 
 async def test_awaitable():
     from asgi_tools.utils import is_awaitable, to_awaitable
@@ -32,3 +36,34 @@ async def test_awaitable():
     assert is_awaitable(test3)
 
     assert await to_awaitable(test1)() == 1
+
+
+async def test_is_awaitable_result():
+    from types import coroutine
+
+    from asgi_tools.utils import is_awaitable_result
+
+    async def test1():
+        return 1
+
+    @coroutine
+    def test2():
+        yield
+
+    def test3():
+        yield
+
+    coro = test1()
+    assert is_awaitable_result(coro)
+    assert await coro == 1
+
+    assert is_awaitable_result(test2())
+    assert not is_awaitable_result(test3())
+    assert not is_awaitable_result(None)
+    assert not is_awaitable_result(1)
+
+    class Awaitable:
+        def __await__(self):
+            yield
+
+    assert is_awaitable_result(Awaitable())